@@ -260,21 +260,18 @@ async def main() -> None:
 
     _LOGGER.debug(args)
     if args.list_input_devices:
-        print("Audio Input devices:")
-        print("=" * 13)
-        for idx, mic in enumerate(sc.all_microphones()):
-            print(f"[{idx}]", mic.name)
+        lines = ["Audio Input devices:", "=" * 13]
+        lines.extend(f"[{idx}] {mic.name}" for idx, mic in enumerate(sc.all_microphones()))
+        print("\n".join(lines))
         return
 
     if args.list_output_devices:
         from mpv import MPV
 
         player = MPV()
-        print("Audio output devices:")
-        print("=" * 14)
-
-        for speaker in player.audio_device_list:  # type: ignore
-            print(speaker["name"] + ":", speaker["description"])
+        lines = ["Audio output devices:", "=" * 14]
+        lines.extend(f"{speaker['name']}: {speaker['description']}" for speaker in player.audio_device_list)  # type: ignore
+        print("\n".join(lines))
         return
 
     # Resolve network interface for mac-address detection
@@ -625,6 +622,22 @@ def _setup_logging(args: argparse.Namespace) -> None:
 # -----------------------------------------------------------------------------
 
 
+def _mic_pcm_gain(mic_volume: int) -> float:
+    """Return the float-to-int16 gain for a mic volume percentage (clamped to 10–100%)."""
+    return max(0.1, min(1.0, mic_volume / 100.0)) * 32767.0
+
+
+def _float_to_pcm16(raw: np.ndarray, gain: float) -> np.ndarray:
+    """Convert float32 samples in [-1, 1] to int16 PCM using a _mic_pcm_gain() factor.
+
+    The volume and full-scale factors are folded into a single multiply and
+    the clip runs in place, so a block costs one float and one int16 array.
+    """
+    scaled: np.ndarray = np.multiply(raw, gain, dtype=np.float32)
+    np.clip(scaled, -32767.0, 32767.0, out=scaled)
+    return scaled.astype("<i2")
+
+
 def process_audio(state: ServerState, mic, block_size: int):
     """Process audio chunks from the microphone."""
     n_channels = state.audio_input_channels
@@ -640,22 +653,28 @@ def process_audio(state: ServerState, mic, block_size: int):
     last_active: Optional[float] = None
     webrtc: Optional[WebRTCProcessor] = None
 
+    # Mic gain is only recomputed when the volume setting changes
+    mic_volume: Optional[int] = None
+    pcm_gain = 0.0
+
     try:
         _LOGGER.debug("Opening audio input device: %s", mic.name)
         with mic.recorder(samplerate=16000, channels=n_channels, blocksize=block_size) as mic_in:
             while True:
                 # Shape: (block_size, n_channels) for stereo, (block_size, 1) for mono.
                 raw = mic_in.record(block_size)  # float32, range [-1, 1]
-                mic_vol_scalar = max(0.1, min(1.0, state.mic_volume / 100.0))
+                if state.mic_volume != mic_volume:
+                    mic_volume = state.mic_volume
+                    pcm_gain = _mic_pcm_gain(mic_volume)
 
                 # Build per-channel byte arrays.  Channel 0 is the primary
                 # microphone; channel 1 (when present) is the reference/speaker
                 # feed used for server-side AEC.
+                pcm = _float_to_pcm16(raw, pcm_gain)
                 channel_chunks: list[bytes] = []
                 for ch in range(n_channels):
-                    col = raw[:, ch] if n_channels > 1 else raw.reshape(-1)
-                    chunk = (np.clip(col * mic_vol_scalar, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
-                    channel_chunks.append(chunk)
+                    col = pcm[:, ch] if n_channels > 1 else pcm.reshape(-1)
+                    channel_chunks.append(col.tobytes())
 
                 # Primary channel drives WebRTC and wake-word detection.
                 audio_chunk = channel_chunks[0]
@@ -1,7 +1,8 @@
 import logging
 from abc import abstractmethod
 from collections.abc import Iterable
-from typing import Callable, List, Optional, Union
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Union
 
 # pylint: disable=no-name-in-module
 from aioesphomeapi.api_pb2 import (  # type: ignore[attr-defined]
@@ -86,9 +87,25 @@ class MediaPlayerEntity(ESPHomeEntity):
         self.music_player = music_player
         self.announce_player = announce_player
         self._on_volume_changed = on_volume_changed
+        self._list_response = ListEntitiesMediaPlayerResponse(
+            object_id=self.object_id,
+            key=self.key,
+            name=self.name,
+            supports_pause=True,
+            feature_flags=SUPPORTED_MEDIA_PLAYER_FEATURES,
+        )
         self.apply_volume_from_state(initial_volume)
         self._log = logging.getLogger(f"{self.__class__.__name__}[{self.key}]")
 
+        # Exact-type lookup instead of an isinstance() chain per incoming message
+        self._message_handlers: Dict[type, Callable[[Any], Iterable[message.Message]]] = {
+            MediaPlayerCommandRequest: self._handle_command,
+            ListEntitiesRequest: self._handle_list_entities,
+            SubscribeHomeAssistantStatesRequest: self._handle_subscribe_states,
+            NumberCommandRequest: self._handle_ignored,
+            SelectCommandRequest: self._handle_ignored,
+        }
+
     def _broadcast_state(self, msgs: Iterable[message.Message]) -> None:
         """Push an asynchronous state change to all connected clients.
 
@@ -102,121 +119,122 @@ class MediaPlayerEntity(ESPHomeEntity):
         else:  # pragma: no cover - no ServerState (e.g. a bare APIServer)
             self.server.send_messages(msgs)
 
+    def _broadcast_idle(self) -> None:
+        self._broadcast_state([self._update_state(MediaPlayerState.IDLE)])
+
     def play(
         self,
         url: Union[str, List[str]],
         announcement: bool = False,
         done_callback: Optional[Callable[[], None]] = None,
     ) -> Iterable[message.Message]:
+        player = self.music_player
+        on_done: Callable[[], None] = self._broadcast_idle
+
         if announcement:
             self._log.debug("PLAY: announcement true")
+            player = self.announce_player
             if self.music_player.is_playing:
                 # Announce, resume music
                 self.music_player.pause()
-                self.announce_player.play(
-                    url,
-                    done_callback=lambda: call_all(self.music_player.resume, done_callback),
-                )
-            else:
-                # Announce, idle
-                self.announce_player.play(
-                    url,
-                    done_callback=lambda: call_all(
-                        lambda: self._broadcast_state([self._update_state(MediaPlayerState.IDLE)]),
-                        done_callback,
-                    ),
-                )
+                on_done = self.music_player.resume
         else:
             self._log.debug("PLAY: announcement false")
-            # Music
-            self.music_player.play(
-                url,
-                done_callback=lambda: call_all(
-                    lambda: self._broadcast_state([self._update_state(MediaPlayerState.IDLE)]),
-                    done_callback,
-                ),
-            )
+
+        player.play(url, done_callback=partial(call_all, on_done, done_callback))
 
         yield self._update_state(MediaPlayerState.PLAYING)
 
     def handle_message(self, msg: message.Message) -> Iterable[message.Message]:
         self._log.debug("handle_message called with msg: %s", msg)
 
-        # Suppress warning for irrelevant NumberCommandRequest
-        if isinstance(msg, (NumberCommandRequest, SelectCommandRequest)):
-            return
-
-        if isinstance(msg, MediaPlayerCommandRequest) and (msg.key == self.key):
-            self._log.debug("MediaPlayerCommandRequest matched for this key")
-
-            if msg.has_media_url:
-                self._log.debug("Executing PLAY")
-                self._log.debug("Message has media URL: %s", msg.media_url)
-                announcement = msg.has_announcement and msg.announcement
-                yield from self.play(msg.media_url, announcement=announcement)
-
-            elif msg.has_command:
-                self._log.debug("Message has command: %s", msg.command)
-                command = MediaPlayerCommand(msg.command)
-
-                if msg.command == MediaPlayerCommand.PAUSE:
-                    self._log.debug("Executing PAUSE")
-                    self.music_player.pause()
-                    yield self._update_state(MediaPlayerState.PAUSED)
-
-                elif msg.command == MediaPlayerCommand.PLAY:
-                    self._log.debug("Executing PLAY / RESUME")
-                    self.music_player.resume()
-                    yield self._update_state(MediaPlayerState.PLAYING)
-
-                elif command == MediaPlayerCommand.STOP:
-                    self._log.debug("Executing STOP")
-                    self.music_player.stop()
-                    yield self._update_state(MediaPlayerState.IDLE)
-
-                elif command == MediaPlayerCommand.MUTE:
-                    self._log.debug("Executing MUTE")
-                    if not self.muted:
-                        self.previous_volume = self.volume
-                        self.volume = 0
-                        self.music_player.set_volume(0)
-                        self.announce_player.set_volume(0)
-                        self.muted = True
-                    yield self._update_state(self.state)
-
-                elif command == MediaPlayerCommand.UNMUTE:
-                    self._log.debug("Executing UNMUTE")
-                    if self.muted:
-                        self.volume = self.previous_volume
-                        self.music_player.set_volume(int(self.volume * 100))
-                        self.announce_player.set_volume(int(self.volume * 100))
-                        self.muted = False
-                    yield self._update_state(self.state)
-
-            elif msg.has_volume:
-                self._log.debug("Message has volume: %.2f", msg.volume)
-                self._apply_volume(msg.volume, persist=True)
-                if hasattr(self.server, "state") and getattr(self.server, "state", None) is not None:
-                    self._log.debug("Persisting volume to preferences")
-                    self.server.state.persist_volume(self.volume)
-                else:
-                    self._log.warning("Cannot persist volume - server.state not available")
-                yield self._update_state(self.state)
-
-        elif isinstance(msg, ListEntitiesRequest):
-            self._log.debug("ListEntitiesRequest received")
-            yield ListEntitiesMediaPlayerResponse(
-                object_id=self.object_id,
-                key=self.key,
-                name=self.name,
-                supports_pause=True,
-                feature_flags=SUPPORTED_MEDIA_PLAYER_FEATURES,
-            )
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
-            self._log.debug("SubscribeHomeAssistantStatesRequest received")
-            yield self._get_state_message()
-        else:
+        handler = self._message_handlers.get(type(msg))
+        if handler is None:
             self._log.warning("Unknown message type received: %s", type(msg))
+            return ()
+
+        return handler(msg)
+
+    def _handle_ignored(self, msg: message.Message) -> Iterable[message.Message]:
+        # Suppress warning for irrelevant NumberCommandRequest/SelectCommandRequest
+        return ()
+
+    def _handle_command(self, msg: MediaPlayerCommandRequest) -> Iterable[message.Message]:
+        if msg.key != self.key:
+            return ()
+
+        self._log.debug("MediaPlayerCommandRequest matched for this key")
+
+        if msg.has_media_url:
+            self._log.debug("Executing PLAY")
+            self._log.debug("Message has media URL: %s", msg.media_url)
+            announcement = msg.has_announcement and msg.announcement
+            return tuple(self.play(msg.media_url, announcement=announcement))
+
+        if msg.has_command:
+            self._log.debug("Message has command: %s", msg.command)
+            command = MediaPlayerCommand(msg.command)
+
+            if msg.command == MediaPlayerCommand.PAUSE:
+                self._log.debug("Executing PAUSE")
+                self.music_player.pause()
+                return (self._update_state(MediaPlayerState.PAUSED),)
+
+            if msg.command == MediaPlayerCommand.PLAY:
+                self._log.debug("Executing PLAY / RESUME")
+                self.music_player.resume()
+                return (self._update_state(MediaPlayerState.PLAYING),)
+
+            if command == MediaPlayerCommand.STOP:
+                self._log.debug("Executing STOP")
+                self.music_player.stop()
+                return (self._update_state(MediaPlayerState.IDLE),)
+
+            if command == MediaPlayerCommand.MUTE:
+                self._log.debug("Executing MUTE")
+                if not self.muted:
+                    self.previous_volume = self.volume
+                    self.volume = 0
+                    self.music_player.set_volume(0)
+                    self.announce_player.set_volume(0)
+                    self.muted = True
+                return (self._update_state(self.state),)
+
+            if command == MediaPlayerCommand.UNMUTE:
+                self._log.debug("Executing UNMUTE")
+                if self.muted:
+                    self.volume = self.previous_volume
+                    self.music_player.set_volume(int(self.volume * 100))
+                    self.announce_player.set_volume(int(self.volume * 100))
+                    self.muted = False
+                return (self._update_state(self.state),)
+
+            return ()
+
+        if msg.has_volume:
+            self._log.debug("Message has volume: %.2f", msg.volume)
+            if not self.muted and max(0.0, min(1.0, float(msg.volume))) == self.volume:
+                # Home Assistant echoing the current volume; nothing to apply or report
+                self._log.debug("Volume unchanged, skipping")
+                return ()
+
+            self._apply_volume(msg.volume, persist=True)
+            if hasattr(self.server, "state") and getattr(self.server, "state", None) is not None:
+                self._log.debug("Persisting volume to preferences")
+                self.server.state.persist_volume(self.volume)
+            else:
+                self._log.warning("Cannot persist volume - server.state not available")
+            return (self._update_state(self.state),)
+
+        return ()
+
+    def _handle_list_entities(self, msg: ListEntitiesRequest) -> Iterable[message.Message]:
+        self._log.debug("ListEntitiesRequest received")
+        return (self._list_response,)
+
+    def _handle_subscribe_states(self, msg: SubscribeHomeAssistantStatesRequest) -> Iterable[message.Message]:
+        self._log.debug("SubscribeHomeAssistantStatesRequest received")
+        return (self._get_state_message(),)
 
     def _update_state(self, new_state: MediaPlayerState) -> MediaPlayerStateResponse:
         self._log.debug("SET NEW STATE: %s => %s", self.state, new_state)
@@ -311,19 +329,22 @@ class MuteSwitchEntity(ESPHomeEntity):
             self._switch_state = new_state
             self._set_muted(new_state)
             # Return the new state immediately
-            yield SwitchStateResponse(key=self.key, state=self._switch_state)
-        elif isinstance(msg, ListEntitiesRequest):
-            yield ListEntitiesSwitchResponse(
-                object_id=self.object_id,
-                key=self.key,
-                name=self.name,
-                entity_category=EntityCategory.CONFIG,
-                icon="mdi:microphone-off",
+            return (SwitchStateResponse(key=self.key, state=self._switch_state),)
+        if isinstance(msg, ListEntitiesRequest):
+            return (
+                ListEntitiesSwitchResponse(
+                    object_id=self.object_id,
+                    key=self.key,
+                    name=self.name,
+                    entity_category=EntityCategory.CONFIG,
+                    icon="mdi:microphone-off",
+                ),
             )
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
+        if isinstance(msg, SubscribeHomeAssistantStatesRequest):
             # Always return our internal switch state
             self.sync_with_state()
-            yield SwitchStateResponse(key=self.key, state=self._switch_state)
+            return (SwitchStateResponse(key=self.key, state=self._switch_state),)
+        return ()
 
 
 class ThinkingSoundEntity(ESPHomeEntity):
@@ -344,6 +365,18 @@ class ThinkingSoundEntity(ESPHomeEntity):
         self._get_thinking_sound_enabled = get_thinking_sound_enabled
         self._set_thinking_sound_enabled = set_thinking_sound_enabled
         self._switch_state = self._get_thinking_sound_enabled()  # Sync internal state
+        self._list_response = ListEntitiesSwitchResponse(
+            object_id=self.object_id,
+            key=self.key,
+            name=self.name,
+            entity_category=EntityCategory.CONFIG,
+            icon="mdi:music-note",
+        )
+        self._message_handlers: Dict[type, Callable[[Any], Iterable[message.Message]]] = {
+            SwitchCommandRequest: self._handle_switch_command,
+            ListEntitiesRequest: self._handle_list_entities,
+            SubscribeHomeAssistantStatesRequest: self._handle_subscribe_states,
+        }
 
     def update_get_thinking_sound_enabled(self, get_thinking_sound_enabled: Callable[[], bool]) -> None:
         # Update the callback used to read the thinking sound enabled state.
@@ -358,25 +391,28 @@ class ThinkingSoundEntity(ESPHomeEntity):
         self._switch_state = self._get_thinking_sound_enabled()
 
     def handle_message(self, msg: message.Message) -> Iterable[message.Message]:
-        if isinstance(msg, SwitchCommandRequest) and (msg.key == self.key):
-            # User toggled the switch - update our internal state and trigger actions
-            new_state = bool(msg.state)
-            self._switch_state = new_state
-            self._set_thinking_sound_enabled(new_state)
-            # Return the new state immediately
-            yield SwitchStateResponse(key=self.key, state=self._switch_state)
-        elif isinstance(msg, ListEntitiesRequest):
-            yield ListEntitiesSwitchResponse(
-                object_id=self.object_id,
-                key=self.key,
-                name=self.name,
-                entity_category=EntityCategory.CONFIG,
-                icon="mdi:music-note",
-            )
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
-            # Always return our internal switch state
-            self.sync_with_state()
-            yield SwitchStateResponse(key=self.key, state=self._switch_state)
+        handler = self._message_handlers.get(type(msg))
+        if handler is None:
+            return ()
+        return handler(msg)
+
+    def _handle_switch_command(self, msg: SwitchCommandRequest) -> Iterable[message.Message]:
+        if msg.key != self.key:
+            return ()
+        # User toggled the switch - update our internal state and trigger actions
+        new_state = bool(msg.state)
+        self._switch_state = new_state
+        self._set_thinking_sound_enabled(new_state)
+        # Return the new state immediately
+        return (SwitchStateResponse(key=self.key, state=self._switch_state),)
+
+    def _handle_list_entities(self, msg: ListEntitiesRequest) -> Iterable[message.Message]:
+        return (self._list_response,)
+
+    def _handle_subscribe_states(self, msg: SubscribeHomeAssistantStatesRequest) -> Iterable[message.Message]:
+        # Always return our internal switch state
+        self.sync_with_state()
+        return (SwitchStateResponse(key=self.key, state=self._switch_state),)
 
 
 class MicSettingEntity(ESPHomeEntity):
@@ -416,27 +452,29 @@ class MicSettingEntity(ESPHomeEntity):
                 new_val = msg.state
                 self._state = new_val
                 self._set_value(new_val)
-                yield SelectStateResponse(key=self.key, state=new_val)
+                return (SelectStateResponse(key=self.key, state=new_val),)
         else:
             if isinstance(msg, NumberCommandRequest) and (msg.key == self.key):
                 new_val = msg.state
                 self._state = new_val
                 self._set_value(new_val)
-                yield NumberStateResponse(key=self.key, state=new_val)
+                return (NumberStateResponse(key=self.key, state=new_val),)
 
         # --- 2. DISCOVERY (TELL HA WHAT TYPE TO SHOW) ---
         if isinstance(msg, ListEntitiesRequest):
             if self.options:
-                yield ListEntitiesSelectResponse(
-                    object_id=self.object_id,
-                    key=self.key,
-                    name=self.name,
-                    options=self.options,
-                    entity_category=EntityCategory.CONFIG,
-                    icon=self.icon,
+                return (
+                    ListEntitiesSelectResponse(
+                        object_id=self.object_id,
+                        key=self.key,
+                        name=self.name,
+                        options=self.options,
+                        entity_category=EntityCategory.CONFIG,
+                        icon=self.icon,
+                    ),
                 )
-            else:
-                yield ListEntitiesNumberResponse(
+            return (
+                ListEntitiesNumberResponse(
                     object_id=self.object_id,
                     key=self.key,
                     name=self.name,
@@ -445,15 +483,16 @@ class MicSettingEntity(ESPHomeEntity):
                     step=1.0,
                     entity_category=EntityCategory.CONFIG,
                     icon=self.icon,
-                )
+                ),
+            )
 
         # --- 3. INITIAL SYNC / STATE UPDATES ---
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
+        if isinstance(msg, SubscribeHomeAssistantStatesRequest):
             self.sync_with_state()
             if self.options:
-                yield SelectStateResponse(key=self.key, state=str(self._state))
-            else:
-                yield NumberStateResponse(key=self.key, state=float(self._state))
+                return (SelectStateResponse(key=self.key, state=str(self._state)),)
+            return (NumberStateResponse(key=self.key, state=float(self._state)),)
+        return ()
 
     def update_get_value(self, get_value: Callable[[], Union[float, str]]) -> None:
         self._get_value = get_value
@@ -503,21 +542,24 @@ class WakeWord1SensitivityNumberEntity(ESPHomeEntity):
             self._log.debug("Sensitivity value changed: %s => %s", self.value, new_value)
             self.value = new_value
             self._set_sensitivity(new_value)
-            yield NumberStateResponse(key=self.key, state=self.value)
-        elif isinstance(msg, ListEntitiesRequest):
-            yield ListEntitiesNumberResponse(
-                object_id=self.object_id,
-                key=self.key,
-                name=self.name,
-                entity_category=EntityCategory.CONFIG,
-                min_value=0.0,
-                max_value=1.0,
-                step=0.001,
-                mode=NumberMode.BOX,
+            return (NumberStateResponse(key=self.key, state=self.value),)
+        if isinstance(msg, ListEntitiesRequest):
+            return (
+                ListEntitiesNumberResponse(
+                    object_id=self.object_id,
+                    key=self.key,
+                    name=self.name,
+                    entity_category=EntityCategory.CONFIG,
+                    min_value=0.0,
+                    max_value=1.0,
+                    step=0.001,
+                    mode=NumberMode.BOX,
+                ),
             )
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
+        if isinstance(msg, SubscribeHomeAssistantStatesRequest):
             self.sync_with_state()
-            yield NumberStateResponse(key=self.key, state=self.value)
+            return (NumberStateResponse(key=self.key, state=self.value),)
+        return ()
 
 
 class WakeWord2SensitivityNumberEntity(ESPHomeEntity):
@@ -558,21 +600,24 @@ class WakeWord2SensitivityNumberEntity(ESPHomeEntity):
             self._log.debug("Second wake word sensitivity value changed: %s => %s", self.value, new_value)
             self.value = new_value
             self._set_sensitivity(new_value)
-            yield NumberStateResponse(key=self.key, state=self.value)
-        elif isinstance(msg, ListEntitiesRequest):
-            yield ListEntitiesNumberResponse(
-                object_id=self.object_id,
-                key=self.key,
-                name=self.name,
-                entity_category=EntityCategory.CONFIG,
-                min_value=0.0,
-                max_value=1.0,
-                step=0.001,
-                mode=NumberMode.BOX,
+            return (NumberStateResponse(key=self.key, state=self.value),)
+        if isinstance(msg, ListEntitiesRequest):
+            return (
+                ListEntitiesNumberResponse(
+                    object_id=self.object_id,
+                    key=self.key,
+                    name=self.name,
+                    entity_category=EntityCategory.CONFIG,
+                    min_value=0.0,
+                    max_value=1.0,
+                    step=0.001,
+                    mode=NumberMode.BOX,
+                ),
             )
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
+        if isinstance(msg, SubscribeHomeAssistantStatesRequest):
             self.sync_with_state()
-            yield NumberStateResponse(key=self.key, state=self.value)
+            return (NumberStateResponse(key=self.key, state=self.value),)
+        return ()
 
 
 class StopWordSensitivityNumberEntity(ESPHomeEntity):
@@ -613,22 +658,25 @@ class StopWordSensitivityNumberEntity(ESPHomeEntity):
             self._log.debug("Stop word sensitivity value changed: %s => %s", self.value, new_value)
             self.value = new_value
             self._set_sensitivity(new_value)
-            yield NumberStateResponse(key=self.key, state=self.value)
-        elif isinstance(msg, ListEntitiesRequest):
-            yield ListEntitiesNumberResponse(
-                object_id=self.object_id,
-                key=self.key,
-                name=self.name,
-                entity_category=EntityCategory.CONFIG,
-                icon="mdi:hand-back-left",
-                min_value=0.0,
-                max_value=1.0,
-                step=0.001,
-                mode=NumberMode.BOX,
+            return (NumberStateResponse(key=self.key, state=self.value),)
+        if isinstance(msg, ListEntitiesRequest):
+            return (
+                ListEntitiesNumberResponse(
+                    object_id=self.object_id,
+                    key=self.key,
+                    name=self.name,
+                    entity_category=EntityCategory.CONFIG,
+                    icon="mdi:hand-back-left",
+                    min_value=0.0,
+                    max_value=1.0,
+                    step=0.001,
+                    mode=NumberMode.BOX,
+                ),
             )
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
+        if isinstance(msg, SubscribeHomeAssistantStatesRequest):
             self.sync_with_state()
-            yield NumberStateResponse(key=self.key, state=self.value)
+            return (NumberStateResponse(key=self.key, state=self.value),)
+        return ()
 
 
 class LEDLightEntity(ESPHomeEntity):
@@ -724,19 +772,22 @@ class LEDLightEntity(ESPHomeEntity):
                     changed = True
             if changed and self._on_changed is not None:
                 self._on_changed()
-            yield self._state_response()
-        elif isinstance(msg, ListEntitiesRequest):
-            yield ListEntitiesLightResponse(
-                object_id=self.object_id,
-                key=self.key,
-                name=self.name,
-                supported_color_modes=[int(self._color_mode())],
-                effects=self.effects_list,
-                icon=self.icon,
-                entity_category=EntityCategory.CONFIG,
+            return (self._state_response(),)
+        if isinstance(msg, ListEntitiesRequest):
+            return (
+                ListEntitiesLightResponse(
+                    object_id=self.object_id,
+                    key=self.key,
+                    name=self.name,
+                    supported_color_modes=[int(self._color_mode())],
+                    effects=self.effects_list,
+                    icon=self.icon,
+                    entity_category=EntityCategory.CONFIG,
+                ),
             )
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
-            yield self._state_response()
+        if isinstance(msg, SubscribeHomeAssistantStatesRequest):
+            return (self._state_response(),)
+        return ()
 
     def _state_response(self) -> LightStateResponse:
         return LightStateResponse(
@@ -776,19 +827,22 @@ class ButtonEventSensorEntity(ESPHomeEntity):
 
     def handle_message(self, msg: message.Message) -> Iterable[message.Message]:
         if isinstance(msg, ListEntitiesRequest):
-            yield ListEntitiesEventResponse(
-                object_id=self.object_id,
-                key=self.key,
-                name=self.name,
-                device_class="button",
-                event_types=self.event_types,
+            return (
+                ListEntitiesEventResponse(
+                    object_id=self.object_id,
+                    key=self.key,
+                    name=self.name,
+                    device_class="button",
+                    event_types=self.event_types,
+                ),
             )
-        elif isinstance(msg, SubscribeHomeAssistantStatesRequest):
-            # Wait until a press fires: yielding with an empty
+        if isinstance(msg, SubscribeHomeAssistantStatesRequest):
+            # Wait until a press fires: sending an empty
             # event_type makes HA reject the state and fail the
             # whole ESPHome config entry to load.
             if self._current_event:
-                yield self._get_state_message()
+                return (self._get_state_message(),)
+        return ()
 
     def _get_state_message(self) -> EventResponse:
         return EventResponse(
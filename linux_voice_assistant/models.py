@@ -37,7 +37,7 @@ class WakeWordType(str, Enum):
     OPEN_WAKE_WORD = "openWakeWord"
 
 
-@dataclass
+@dataclass(slots=True)
 class AvailableWakeWord:
     id: str
     type: WakeWordType
@@ -63,7 +63,7 @@ class AvailableWakeWord:
         raise ValueError(f"Unexpected wake word type: {self.type}")
 
 
-@dataclass
+@dataclass(slots=True)
 class LightRegistration:
     """Capabilities a peripheral declares for one of its Light entities.
 
@@ -80,7 +80,7 @@ class LightRegistration:
     supports_brightness: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Preferences:
     active_wake_words: List[Optional[str]] = field(default_factory=list)
     volume: Optional[float] = None
@@ -1,6 +1,7 @@
 # mpv_player.py
 import logging
-from typing import Callable, List, Optional, Union
+from collections import deque
+from typing import Callable, Deque, List, Optional, Union
 
 from .player.libmpv import LibMpvPlayer
 from .player.state import PlayerState
@@ -18,7 +19,7 @@ class MpvMediaPlayer:
         self._log = logging.getLogger(self.__class__.__name__)
         self._player = LibMpvPlayer(device=device)
         self._done_callback: Optional[Callable[[], None]] = None
-        self._playlist: List[str] = []
+        self._playlist: Deque[str] = deque()
 
         self._log.debug("MpvMediaPlayer initialized (device=%s)", device)
 
@@ -38,9 +39,9 @@ class MpvMediaPlayer:
         """
         # Handle single URL vs list
         if isinstance(url, str):
-            urls = [url]
+            urls: Deque[str] = deque((url,))
         else:
-            urls = list(url)  # Copy the list
+            urls = deque(url)  # Copy the list
 
         if not urls:
             self._log.warning("play() called with empty URL list")
@@ -60,14 +61,14 @@ class MpvMediaPlayer:
         self._done_callback = done_callback
 
         # Start playing first URL
-        next_url = self._playlist.pop(0)
+        next_url = self._playlist.popleft()
         self._player.play(next_url, done_callback=self._on_track_finished, stop_first=stop_first)
 
     def _on_track_finished(self) -> None:
         """Called when a track finishes - plays next or invokes done callback."""
         if self._playlist:
             # More tracks to play
-            next_url = self._playlist.pop(0)
+            next_url = self._playlist.popleft()
             self._log.debug("Playing next URL from playlist: %s", next_url)
             self._player.play(next_url, done_callback=self._on_track_finished, stop_first=False)
         else:
@@ -103,7 +103,7 @@ import time
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, Optional, Set
 
-from aioesphomeapi.api_pb2 import MediaPlayerStateResponse  # type: ignore[attr-defined]  # pylint: disable=no-name-in-module
+from aioesphomeapi.api_pb2 import MediaPlayerStateResponse, SwitchStateResponse  # type: ignore[attr-defined]  # pylint: disable=no-name-in-module
 from aioesphomeapi.model import MediaPlayerState  # type: ignore[import]
 
 if TYPE_CHECKING:
@@ -163,6 +163,25 @@ class LVACommand(str, Enum):
     REGISTER_BUTTON = "register_button"
 
 
+# Persistent/visual states tracked by emit_event for the connect snapshot
+_STATE_EVENTS = frozenset(
+    {
+        LVAEvent.WAKE_WORD_DETECTED,
+        LVAEvent.LISTENING,
+        LVAEvent.THINKING,
+        LVAEvent.TTS_SPEAKING,
+        LVAEvent.TTS_FINISHED,
+        LVAEvent.IDLE,
+        LVAEvent.MUTED,
+        LVAEvent.TIMER_TICKING,
+        LVAEvent.TIMER_RINGING,
+        LVAEvent.MEDIA_PLAYER_PLAYING,
+        LVAEvent.DISCONNECTED,
+        LVAEvent.PIPELINE_ERROR,
+    }
+)
+
+
 # ---------------------------------------------------------------------------
 # Server
 # ---------------------------------------------------------------------------
@@ -615,10 +634,6 @@ class PeripheralAPIServer:
 
         entity = state.mute_switch_entity
         entity._switch_state = muted  # pylint: disable=protected-access
-
-        # pylint: disable=no-name-in-module
-        from aioesphomeapi.api_pb2 import SwitchStateResponse  # type: ignore[attr-defined]
-
         satellite.send_messages([SwitchStateResponse(key=entity.key, state=muted)])
 
     # ------------------------------------------------------------------
@@ -646,20 +661,6 @@ class PeripheralAPIServer:
         # connect via _send_snapshot.  Only persistent/visual states are
         # stored — transient informational events are skipped.
         # ----------------------------------------------------------------
-        _STATE_EVENTS = {
-            LVAEvent.WAKE_WORD_DETECTED,
-            LVAEvent.LISTENING,
-            LVAEvent.THINKING,
-            LVAEvent.TTS_SPEAKING,
-            LVAEvent.TTS_FINISHED,
-            LVAEvent.IDLE,
-            LVAEvent.MUTED,
-            LVAEvent.TIMER_TICKING,
-            LVAEvent.TIMER_RINGING,
-            LVAEvent.MEDIA_PLAYER_PLAYING,
-            LVAEvent.DISCONNECTED,
-            LVAEvent.PIPELINE_ERROR,
-        }
         if event in _STATE_EVENTS:
             self._current_state = event
             self._current_state_data = data or None
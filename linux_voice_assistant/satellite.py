@@ -63,7 +63,6 @@ from .entity import (
 )
 from .models import AvailableWakeWord, ServerState, WakeWordType
 from .peripheral_api import LVAEvent
-from .util import call_all
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -448,13 +447,18 @@ class VoiceSatelliteProtocol(APIServer):
 
     def _set_thinking_sound_enabled(self, new_state: bool) -> None:
         self.state.thinking_sound_enabled = bool(new_state)
-        self.state.preferences.thinking_sound = 1 if self.state.thinking_sound_enabled else 0
+        thinking_sound = 1 if self.state.thinking_sound_enabled else 0
 
         if self.state.thinking_sound_enabled:
             _LOGGER.debug("Thinking sound enabled")
         else:
             _LOGGER.debug("Thinking sound disabled")
-            pass
+
+        # Home Assistant re-sends the switch state; skip rewriting unchanged preferences
+        if self.state.preferences.thinking_sound == thinking_sound:
+            return
+
+        self.state.preferences.thinking_sound = thinking_sound
         self.state.save_preferences()
 
     def _set_sensitivity_1(self, new_value: float) -> None:
@@ -1002,12 +1006,13 @@ class VoiceSatelliteProtocol(APIServer):
 
         self.state.tts_player.play(
             self.state.timer_finished_sound,
-            done_callback=lambda: call_all(
-                lambda: time.sleep(1.0),
-                self._play_timer_finished,
-            ),
+            done_callback=self._schedule_timer_finished,
         )
 
+    def _schedule_timer_finished(self) -> None:
+        # Pause between rings without blocking the player's event thread
+        threading.Timer(1.0, self._play_timer_finished).start()
+
     def connection_made(self, transport) -> None:
         super().connection_made(transport)
         # Track every live connection so asynchronous entity-state changes can be
@@ -1082,16 +1087,21 @@ class VoiceSatelliteProtocol(APIServer):
 
             # Send states after connect
             states: List[message.Message] = []
+            subscribe_request = SubscribeHomeAssistantStatesRequest()
+            debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
             _LOGGER.debug("Found %d entities in state", len(self.state.entities))
             for i, entity in enumerate(self.state.entities):
-                entity_states = list(entity.handle_message(SubscribeHomeAssistantStatesRequest()))
+                entity_states = entity.handle_message(subscribe_request)
+                if debug_enabled:
+                    entity_states = list(entity_states)
+                    _LOGGER.debug("Entity %d (%s) returned %d state messages", i, type(entity).__name__, len(entity_states))
                 states.extend(entity_states)
-                _LOGGER.debug("Entity %d (%s) returned %d state messages", i, type(entity).__name__, len(entity_states))
 
             _LOGGER.debug("Total state messages to send: %d", len(states))
             self.send_messages(states)
-            for i, msg in enumerate(states):
-                _LOGGER.debug("Sent state message %d: %s", i, type(msg).__name__)
+            if debug_enabled:
+                for i, msg in enumerate(states):
+                    _LOGGER.debug("Sent state message %d: %s", i, type(msg).__name__)
             _LOGGER.debug("All entity states sent after connect")
 
             # Notify peripherals that Home Assistant is now connected
@@ -1108,11 +1118,16 @@ class VoiceSatelliteProtocol(APIServer):
         config_path = eww_dir / f"{external_wake_word.id}.json"
         should_download_config = not config_path.exists()
 
-        # Check if we need to download the model file
+        # Check if we need to download the model file.
+        # A single stat() both tests for existence and yields the size.
         model_path = eww_dir / f"{external_wake_word.id}.tflite"
         should_download_model = True
-        if model_path.exists():
-            model_size = model_path.stat().st_size
+        try:
+            model_size: Optional[int] = model_path.stat().st_size
+        except FileNotFoundError:
+            model_size = None
+
+        if model_size is not None:
             if model_size == external_wake_word.model_size:
                 with open(model_path, "rb") as model_file:
                     model_hash = hashlib.sha256(model_file.read()).hexdigest()
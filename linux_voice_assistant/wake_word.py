@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Union
 
@@ -12,6 +13,27 @@ from .models import AvailableWakeWord, WakeWordType
 _LOGGER = logging.getLogger(__name__)
 
 
+def _list_config_files(wake_word_dir: Path) -> List[Path]:
+    """
+    Lists the JSON configuration files directly inside a directory.
+
+    Uses os.scandir() so the file type comes from the directory listing
+    instead of building a pathlib glob selector and stat'ing every match.
+
+    Args:
+        wake_word_dir: Directory to list
+
+    Returns:
+        Paths of all *.json files, or an empty list if the directory is missing or unreadable
+    """
+    try:
+        with os.scandir(wake_word_dir) as entries:
+            return [Path(entry.path) for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+    except OSError:
+        # Path.glob() silently yielded nothing here, including on PermissionError
+        return []
+
+
 def find_available_wake_words(wake_word_dirs: List[Path], stop_model_id: str) -> Dict[str, AvailableWakeWord]:
     """
     Searches all available wake words in the specified directories.
@@ -26,12 +48,16 @@ def find_available_wake_words(wake_word_dirs: List[Path], stop_model_id: str) ->
     """
     available_wake_words: Dict[str, AvailableWakeWord] = {}
 
-    _LOGGER.debug("Searching for wake words in directories: %s", [str(d) for d in wake_word_dirs])
+    # Some debug messages stat the filesystem, only pay for that when they are emitted
+    debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        _LOGGER.debug("Searching for wake words in directories: %s", [str(d) for d in wake_word_dirs])
 
     for wake_word_dir in wake_word_dirs:
-        _LOGGER.debug("Checking directory: %s (exists: %s)", wake_word_dir, wake_word_dir.exists())
+        if debug_enabled:
+            _LOGGER.debug("Checking directory: %s (exists: %s)", wake_word_dir, wake_word_dir.exists())
 
-        config_files = list(wake_word_dir.glob("*.json"))
+        config_files = _list_config_files(wake_word_dir)
         _LOGGER.debug("Found %d JSON configuration files in %s", len(config_files), wake_word_dir)
 
         for model_config_path in config_files:
@@ -54,7 +80,8 @@ def find_available_wake_words(wake_word_dirs: List[Path], stop_model_id: str) ->
                 else:
                     wake_word_path = model_config_path
 
-                _LOGGER.debug("Model path resolved to: %s (exists: %s)", wake_word_path, wake_word_path.exists())
+                if debug_enabled:
+                    _LOGGER.debug("Model path resolved to: %s (exists: %s)", wake_word_path, wake_word_path.exists())
 
                 # Get type specific configuration
                 type_config = model_config.get(model_type.value, {})
@@ -250,9 +277,10 @@ def load_stop_model(wake_word_dirs: List[Path], stop_model_id: str) -> Optional[
 
     for wake_word_dir in wake_word_dirs:
         stop_config_path = wake_word_dir / f"{stop_model_id}.json"
-        _LOGGER.debug("Checking stop model path: %s (exists: %s)", stop_config_path, stop_config_path.exists())
+        stop_config_exists = stop_config_path.exists()
+        _LOGGER.debug("Checking stop model path: %s (exists: %s)", stop_config_path, stop_config_exists)
 
-        if not stop_config_path.exists():
+        if not stop_config_exists:
             continue
 
         _LOGGER.debug("Found stop model configuration at: %s", stop_config_path)
@@ -29,13 +29,20 @@ class WebRTCProcessor:
         Returns processed bytes (may be shorter than input if buffering).
         """
         self._buffer.extend(raw_bytes)
+        frame_size = self.FRAME_SIZE_BYTES
+        consumed = len(self._buffer) - (len(self._buffer) % frame_size)
+        if not consumed:
+            return b""
+
         processed_chunks: list[bytes] = []
 
-        while len(self._buffer) >= self.FRAME_SIZE_BYTES:
-            frame = bytes(self._buffer[: self.FRAME_SIZE_BYTES])
-            del self._buffer[: self.FRAME_SIZE_BYTES]  # drain in-place
+        # Copy frames straight out of the buffer, without an intermediate bytearray slice
+        with memoryview(self._buffer) as view:
+            for offset in range(0, consumed, frame_size):
+                result = self.apm.Process10ms(bytes(view[offset : offset + frame_size]))
+                processed_chunks.append(result.audio)
 
-            result = self.apm.Process10ms(frame)
-            processed_chunks.append(result.audio)
+        # Drain all processed frames at once instead of shifting the buffer per frame
+        del self._buffer[:consumed]
 
         return b"".join(processed_chunks)
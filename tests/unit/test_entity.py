@@ -66,6 +66,20 @@ def make_mute_switch(server=None, key=2, initial_muted=False):
     return entity
 
 
+def make_thinking_sound(server=None, key=3, enabled=False):
+    from linux_voice_assistant.entity import ThinkingSoundEntity
+
+    server = server or make_server()
+    return ThinkingSoundEntity(
+        server=server,
+        key=key,
+        name="Thinking Sound",
+        object_id="thinking_sound",
+        get_thinking_sound_enabled=MagicMock(return_value=enabled),
+        set_thinking_sound_enabled=MagicMock(),
+    )
+
+
 def make_mic_setting(server=None, key=3, options=None, value=0.0):
     from linux_voice_assistant.entity import MicSettingEntity
 
@@ -137,6 +151,12 @@ class TestMediaPlayerEntityListEntities:
         msgs = list(entity.handle_message(ListEntitiesRequest()))
         assert msgs[0].supports_pause is True
 
+    def test_list_entities_response_reused(self):
+        entity = make_media_player()
+        first = list(entity.handle_message(ListEntitiesRequest()))[0]
+        second = list(entity.handle_message(ListEntitiesRequest()))[0]
+        assert first is second
+
 
 class TestMediaPlayerEntitySubscribeStates:
     def test_subscribe_states_yields_state_response(self):
@@ -150,6 +170,21 @@ class TestMediaPlayerEntitySubscribeStates:
         msgs = list(entity.handle_message(SubscribeHomeAssistantStatesRequest()))
         assert msgs[0].key == 7
 
+    def test_subscribe_states_reflects_current_volume_and_mute(self):
+        entity = make_media_player(key=7, initial_volume=0.4)
+        list(entity.handle_message(MediaPlayerCommandRequest(key=7, has_command=True, command=MediaPlayerCommand.MUTE)))
+        msgs = list(entity.handle_message(SubscribeHomeAssistantStatesRequest()))
+        assert msgs[0].muted is True
+        assert msgs[0].volume == 0
+
+    def test_earlier_state_messages_are_not_mutated(self):
+        entity = make_media_player()
+        paused = entity._update_state(MediaPlayerState.PAUSED)
+        playing = entity._update_state(MediaPlayerState.PLAYING)
+        assert paused is not playing
+        assert paused.state == MediaPlayerState.PAUSED
+        assert playing.state == MediaPlayerState.PLAYING
+
 
 class TestMediaPlayerEntityVolume:
     def test_apply_volume_sets_both_players(self):
@@ -193,6 +228,15 @@ class TestMediaPlayerEntityVolume:
         msgs = list(entity.handle_message(msg))
         assert any(isinstance(m, MediaPlayerStateResponse) for m in msgs)
 
+    def test_volume_command_unchanged_volume_skipped(self):
+        entity = make_media_player(key=1, initial_volume=0.5)
+        entity.music_player.set_volume.reset_mock()
+        entity.server.state.persist_volume = MagicMock()
+        msg = MediaPlayerCommandRequest(key=1, has_volume=True, volume=0.5)
+        assert list(entity.handle_message(msg)) == []
+        entity.music_player.set_volume.assert_not_called()
+        entity.server.state.persist_volume.assert_not_called()
+
     def test_volume_command_wrong_key_ignored(self):
         entity = make_media_player(key=1)
         msg = MediaPlayerCommandRequest(key=99, has_volume=True, volume=0.6)
@@ -267,6 +311,84 @@ class TestMediaPlayerEntityPlayback:
         list(entity.handle_message(msg))
         entity.music_player.resume.assert_called_once()
 
+    def test_music_done_callback_broadcasts_idle_and_chains(self):
+        entity = make_media_player(key=1)
+        cb = MagicMock()
+        list(entity.play("http://example.com/a.mp3", done_callback=cb))
+        entity.music_player.play.call_args.kwargs["done_callback"]()
+        assert entity.state == MediaPlayerState.IDLE
+        entity.server.state.broadcast.assert_called_once()
+        cb.assert_called_once()
+
+    def test_announcement_done_callback_resumes_music(self):
+        entity = make_media_player(key=1)
+        entity.music_player.is_playing = True
+        list(entity.play("http://example.com/a.mp3", announcement=True))
+        entity.announce_player.play.call_args.kwargs["done_callback"]()
+        entity.music_player.resume.assert_called_once()
+
+    def test_announcement_while_idle_returns_to_idle(self):
+        entity = make_media_player(key=1)
+        entity.music_player.is_playing = False
+        list(entity.play("http://example.com/a.mp3", announcement=True))
+        entity.music_player.play.assert_not_called()
+        entity.announce_player.play.call_args.kwargs["done_callback"]()
+        entity.music_player.resume.assert_not_called()
+        assert entity.state == MediaPlayerState.IDLE
+
+
+class TestMediaPlayerEntityDispatch:
+    def test_number_and_select_commands_ignored(self):
+        entity = make_media_player(key=1)
+        assert list(entity.handle_message(NumberCommandRequest(key=1, state=0.5))) == []
+        assert list(entity.handle_message(SelectCommandRequest(key=1, state="x"))) == []
+
+    def test_unknown_message_type_yields_nothing(self):
+        entity = make_media_player(key=1)
+        assert list(entity.handle_message(SwitchCommandRequest(key=1, state=True))) == []
+
+    def test_command_for_other_key_returns_empty_tuple(self):
+        entity = make_media_player(key=1)
+        msg = MediaPlayerCommandRequest(key=99, has_command=True, command=MediaPlayerCommand.PAUSE)
+        assert entity.handle_message(msg) == ()
+
+    def test_handlers_return_tuples(self):
+        entity = make_media_player(key=1)
+        pause = MediaPlayerCommandRequest(key=1, has_command=True, command=MediaPlayerCommand.PAUSE)
+        result = entity.handle_message(pause)
+        assert isinstance(result, tuple)
+        assert len(result) == 1
+        entity.music_player.pause.assert_called_once()
+        assert isinstance(entity.handle_message(ListEntitiesRequest()), tuple)
+        assert isinstance(entity.handle_message(SubscribeHomeAssistantStatesRequest()), tuple)
+        assert isinstance(entity.handle_message(MediaPlayerCommandRequest(key=1, has_media_url=True, media_url="http://example.com/a.mp3")), tuple)
+
+
+# ---------------------------------------------------------------------------
+# ThinkingSoundEntity
+# ---------------------------------------------------------------------------
+
+
+class TestThinkingSoundEntity:
+    def test_switch_command_for_other_key_returns_empty_tuple(self):
+        entity = make_thinking_sound(key=3)
+        assert entity.handle_message(SwitchCommandRequest(key=2, state=True)) == ()
+        entity._set_thinking_sound_enabled.assert_not_called()
+
+    def test_switch_command_returns_state_tuple(self):
+        entity = make_thinking_sound(key=3)
+        (response,) = entity.handle_message(SwitchCommandRequest(key=3, state=True))
+        assert isinstance(response, SwitchStateResponse)
+        assert response.state is True
+        entity._set_thinking_sound_enabled.assert_called_once_with(True)
+
+    def test_list_and_subscribe_return_tuples(self):
+        entity = make_thinking_sound(enabled=True)
+        (listing,) = entity.handle_message(ListEntitiesRequest())
+        assert isinstance(listing, ListEntitiesSwitchResponse)
+        (state,) = entity.handle_message(SubscribeHomeAssistantStatesRequest())
+        assert state.state is True
+
 
 # ---------------------------------------------------------------------------
 # MuteSwitchEntity
@@ -302,6 +424,10 @@ class TestMuteSwitchEntity:
         list(entity.handle_message(msg))
         entity._set_muted.assert_not_called()
 
+    def test_unrelated_message_returns_empty(self):
+        entity = make_mute_switch(key=2)
+        assert entity.handle_message(NumberCommandRequest(key=2, state=1.0)) == ()
+
     def test_list_entities_request_yields_switch_response(self):
         entity = make_mute_switch()
         msgs = list(entity.handle_message(ListEntitiesRequest()))
@@ -16,47 +16,92 @@ def make_audio_chunk(samples: int = 1024, value: float = 0.0) -> np.ndarray:
 
 
 class TestProcessAudioMicVolume:
-    def test_mic_volume_scalar_at_100(self, tmp_path):
+    def test_mic_volume_scalar_at_100(self):
         """mic_volume=100 → scalar=1.0 → no attenuation."""
-        state = make_state(tmp_path)
-        state.mic_volume = 100
-        state.satellite = None  # no satellite → loop exits immediately
+        from linux_voice_assistant.__main__ import _mic_pcm_gain
 
-        # The scalar clamp: max(0.1, min(1.0, 100/100)) = 1.0
-        scalar = max(0.1, min(1.0, state.mic_volume / 100.0))
-        assert scalar == pytest.approx(1.0)
+        assert _mic_pcm_gain(100) == pytest.approx(1.0 * 32767.0)
 
-    def test_mic_volume_scalar_at_50(self, tmp_path):
-        state = make_state(tmp_path)
-        state.mic_volume = 50
-        scalar = max(0.1, min(1.0, state.mic_volume / 100.0))
-        assert scalar == pytest.approx(0.5)
+    def test_mic_volume_scalar_at_50(self):
+        from linux_voice_assistant.__main__ import _mic_pcm_gain
 
-    def test_mic_volume_scalar_clamped_above_100(self, tmp_path):
-        state = make_state(tmp_path)
-        state.mic_volume = 200
-        scalar = max(0.1, min(1.0, state.mic_volume / 100.0))
-        assert scalar == pytest.approx(1.0)
+        assert _mic_pcm_gain(50) == pytest.approx(0.5 * 32767.0)
+
+    def test_mic_volume_scalar_clamped_above_100(self):
+        from linux_voice_assistant.__main__ import _mic_pcm_gain
+
+        assert _mic_pcm_gain(200) == pytest.approx(1.0 * 32767.0)
+
+    def test_mic_volume_scalar_minimum_is_0_1(self):
+        from linux_voice_assistant.__main__ import _mic_pcm_gain
+
+        assert _mic_pcm_gain(0) == pytest.approx(0.1 * 32767.0)
+
+    def test_mic_gain_recomputed_only_when_volume_changes(self, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        import linux_voice_assistant.__main__ as main_module
 
-    def test_mic_volume_scalar_minimum_is_0_1(self, tmp_path):
         state = make_state(tmp_path)
-        state.mic_volume = 0
-        scalar = max(0.1, min(1.0, state.mic_volume / 100.0))
-        assert scalar == pytest.approx(0.1)
+        state.mic_volume = 100
+        state.satellite = None
+        state.audio_input_channels = 1
+        volumes = iter([100, 100, 50, 50])
+
+        def record(block_size):
+            try:
+                state.mic_volume = next(volumes)
+            except StopIteration:
+                raise RuntimeError("done") from None
+            return make_audio_chunk(block_size).reshape(-1, 1)
+
+        mic = MagicMock()
+        mic.recorder.return_value.__enter__.return_value.record.side_effect = record
+        with patch.object(main_module, "_mic_pcm_gain", wraps=main_module._mic_pcm_gain) as gain, pytest.raises(SystemExit):
+            main_module.process_audio(state, mic, 1024)
+
+        assert [c.args[0] for c in gain.call_args_list] == [100, 50]
 
     def test_audio_chunk_scaled_by_mic_volume(self):
         """Verify the numpy scaling produces correct output."""
-        audio = make_audio_chunk(value=0.5)
-        mic_vol_scalar = 0.5
-        result = np.clip(audio * mic_vol_scalar, -1.0, 1.0)
-        assert np.allclose(result, 0.25)
-
-    def test_audio_chunk_clipped_to_bounds(self):
-        """Values that exceed [-1, 1] after scaling should be clipped."""
-        audio = make_audio_chunk(value=1.0)
-        mic_vol_scalar = 2.0  # would push to 2.0 without clip
-        result = np.clip(audio * mic_vol_scalar, -1.0, 1.0)
-        assert np.all(result <= 1.0)
+        from linux_voice_assistant.__main__ import _float_to_pcm16
+
+        audio = make_audio_chunk(value=0.5).reshape(-1, 1)
+        result = _float_to_pcm16(audio, 0.5 * 32767.0)
+        assert np.all(np.abs(result.astype(np.int32) - 8191) <= 1)
+
+    def test_audio_chunk_clipped_to_full_scale(self):
+        """Values that exceed [-1, 1] after scaling should be clipped to ±32767."""
+        from linux_voice_assistant.__main__ import _float_to_pcm16
+
+        audio = np.array([[2.0], [-2.0], [1.0], [-1.0]], dtype=np.float32)
+        result = _float_to_pcm16(audio, 32767.0)
+        assert result.reshape(-1).tolist() == [32767, -32767, 32767, -32767]
+
+    def test_pcm_is_little_endian_int16(self):
+        from linux_voice_assistant.__main__ import _float_to_pcm16
+
+        result = _float_to_pcm16(make_audio_chunk(value=0.25).reshape(-1, 1), 32767.0)
+        assert result.dtype == np.dtype("<i2")
+        assert len(result.tobytes()) == 1024 * 2
+
+    def test_mono_block_reshapes_to_one_channel(self):
+        from linux_voice_assistant.__main__ import _float_to_pcm16
+
+        audio = np.linspace(-1.0, 1.0, 256, dtype=np.float32).reshape(-1, 1)
+        result = _float_to_pcm16(audio, 32767.0)
+        assert result.shape == (256, 1)
+        assert result.reshape(-1).tobytes() == result[:, 0].tobytes()
+
+    def test_stereo_block_splits_into_channel_columns(self):
+        from linux_voice_assistant.__main__ import _float_to_pcm16
+
+        audio = np.column_stack([np.full(64, 0.5, dtype=np.float32), np.full(64, -0.5, dtype=np.float32)])
+        result = _float_to_pcm16(audio, 32767.0)
+        left = np.frombuffer(result[:, 0].tobytes(), dtype="<i2")
+        right = np.frombuffer(result[:, 1].tobytes(), dtype="<i2")
+        assert np.all(np.abs(left.astype(np.int32) - 16383) <= 1)
+        assert np.all(np.abs(right.astype(np.int32) + 16383) <= 1)
 
 
 # ---------------------------------------------------------------------------
@@ -81,6 +81,11 @@ class TestPreferences:
         p1.active_wake_words.append("okay_nabu")
         assert p2.active_wake_words == []
 
+    def test_rejects_unknown_attributes(self):
+        p = make_preferences()
+        with pytest.raises(AttributeError):
+            p.not_a_preference = 1  # type: ignore[attr-defined]
+
 
 # ---------------------------------------------------------------------------
 # ServerState.save_preferences()
@@ -1,5 +1,6 @@
 """Unit tests for MpvMediaPlayer."""
 
+from collections import deque
 from unittest.mock import MagicMock, patch
 
 # ---------------------------------------------------------------------------
@@ -50,7 +51,7 @@ class TestInit:
 
     def test_playlist_starts_empty(self):
         player = make_player()
-        assert player._playlist == []
+        assert list(player._playlist) == []
 
 
 # ---------------------------------------------------------------------------
@@ -79,12 +80,12 @@ class TestPlay:
     def test_play_list_stores_remaining_in_playlist(self):
         player = make_player()
         player.play(["http://a.com/1.mp3", "http://a.com/2.mp3", "http://a.com/3.mp3"])
-        assert player._playlist == ["http://a.com/2.mp3", "http://a.com/3.mp3"]
+        assert list(player._playlist) == ["http://a.com/2.mp3", "http://a.com/3.mp3"]
 
     def test_play_single_url_playlist_is_empty(self):
         player = make_player()
         player.play("http://example.com/audio.mp3")
-        assert player._playlist == []
+        assert list(player._playlist) == []
 
     def test_play_stores_done_callback(self):
         player = make_player()
@@ -126,7 +127,7 @@ class TestPlay:
 class TestOnTrackFinished:
     def test_plays_next_url_when_playlist_has_items(self):
         player = make_player()
-        player._playlist = ["http://a.com/2.mp3"]
+        player._playlist = deque(["http://a.com/2.mp3"])
         player._on_track_finished()
         args, _ = player._mock.play.call_args
         assert args[0] == "http://a.com/2.mp3"
@@ -135,21 +136,21 @@ class TestOnTrackFinished:
         player = make_player()
         cb = MagicMock()
         player._done_callback = cb
-        player._playlist = []
+        player._playlist = deque()
         player._on_track_finished()
         cb.assert_called_once()
 
     def test_clears_done_callback_after_invoking(self):
         player = make_player()
         player._done_callback = MagicMock()
-        player._playlist = []
+        player._playlist = deque()
         player._on_track_finished()
         assert player._done_callback is None
 
     def test_no_error_when_done_callback_is_none(self):
         player = make_player()
         player._done_callback = None
-        player._playlist = []
+        player._playlist = deque()
         player._on_track_finished()  # should not raise
 
 
@@ -173,6 +173,14 @@ class TestSetThinkingSoundEnabled:
         sat._set_thinking_sound_enabled(True)
         assert sat.state.preferences_path.exists()
 
+    def test_unchanged_value_skips_save(self, tmp_path):
+        sat = make_satellite(tmp_path)
+        sat._set_thinking_sound_enabled(True)
+        with patch.object(sat.state, "save_preferences") as save:
+            sat._set_thinking_sound_enabled(True)
+        save.assert_not_called()
+        assert sat.state.thinking_sound_enabled is True
+
 
 # ---------------------------------------------------------------------------
 # _set_sensitivity_1/2 and _set_stop_sensitivity
@@ -312,6 +320,25 @@ class TestStop:
         sat.state.tts_player.stop.assert_called()
 
 
+# ---------------------------------------------------------------------------
+# Timer ringing
+# ---------------------------------------------------------------------------
+
+
+class TestTimerRing:
+    def test_ring_schedules_next_ring_without_sleeping(self, tmp_path):
+        sat = make_satellite(tmp_path)
+        sat._timer_finished = True
+        sat._play_timer_finished()
+        done_callback = sat.state.tts_player.play.call_args.kwargs["done_callback"]
+
+        with patch("linux_voice_assistant.satellite.threading.Timer") as timer_cls:
+            done_callback()
+
+        timer_cls.assert_called_once_with(1.0, sat._play_timer_finished)
+        timer_cls.return_value.start.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # duck() / unduck()
 # ---------------------------------------------------------------------------
@@ -68,6 +68,14 @@ class TestFindAvailableWakeWords:
         result = find_available_wake_words([tmp_path / "does_not_exist"], stop_model_id="stop")
         assert result == {}
 
+    def test_returns_empty_for_unreadable_directory(self, tmp_path):
+        write_json(tmp_path / "okay_nabu.json", make_micro_json())
+        from linux_voice_assistant.wake_word import find_available_wake_words
+
+        with patch("linux_voice_assistant.wake_word.os.scandir", side_effect=PermissionError(13, "Permission denied")):
+            result = find_available_wake_words([tmp_path], stop_model_id="stop")
+        assert result == {}
+
     def test_micro_wake_word_path_is_config_path(self, tmp_path):
         write_json(tmp_path / "okay_nabu.json", make_micro_json())
         from linux_voice_assistant.wake_word import find_available_wake_words
@@ -135,6 +143,15 @@ class TestFindAvailableWakeWords:
         result = find_available_wake_words([tmp_path], stop_model_id="stop")
         assert result["okay_nabu"].type == WakeWordType.MICRO_WAKE_WORD
 
+    def test_ignores_non_json_files_and_directories(self, tmp_path):
+        write_json(tmp_path / "okay_nabu.json", make_micro_json())
+        (tmp_path / "okay_nabu.tflite").write_bytes(b"")
+        (tmp_path / "not_a_model.json").mkdir()
+        from linux_voice_assistant.wake_word import find_available_wake_words
+
+        result = find_available_wake_words([tmp_path], stop_model_id="stop")
+        assert list(result) == ["okay_nabu"]
+
 
 # ---------------------------------------------------------------------------
 # load_wake_models()
@@ -119,6 +119,20 @@ class TestProcessBuffering:
         result = processor.process(make_audio(FRAME_SIZE * 2))
         assert result == b"\x01" * FRAME_SIZE + b"\x02" * FRAME_SIZE
 
+    def test_frames_passed_as_bytes_in_order(self, processor):
+        data = make_audio(FRAME_SIZE, fill=0x01) + make_audio(FRAME_SIZE, fill=0x02)
+        processor.process(data)
+        frames = [c.args[0] for c in processor._mock_apm.Process10ms.call_args_list]
+        assert frames == [make_audio(FRAME_SIZE, fill=0x01), make_audio(FRAME_SIZE, fill=0x02)]
+        assert all(isinstance(frame, bytes) for frame in frames)
+
+    def test_many_frames_drained_in_one_call(self, processor):
+        data = make_audio(FRAME_SIZE * 10) + make_audio(7, fill=0xCD)
+        result = processor.process(data)
+        assert len(result) == FRAME_SIZE * 10
+        assert processor._mock_apm.Process10ms.call_count == 10
+        assert bytes(processor._buffer) == make_audio(7, fill=0xCD)
+
     def test_multiple_process_calls_accumulate_buffer(self, processor):
         """Remainder from first call is used in second call."""
         processor.process(make_audio(200))  # 200 buffered, no flush